@@ -4,9 +4,26 @@ Streamlit app for visualizing CIS people data.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+import importlib.util
 from pathlib import Path
 
+# Prefer orjson for faster loading, fallback to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parquet needs pyarrow, otherwise only JSON/CSV can be loaded
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+COLUMNS = ['name', 'honorific', 'title', 'category', 'profile_url']
+
+# Filter combinations kept per cached helper, so memory stays bounded while typing a search
+CACHE_ENTRIES = 32
+
 # Page config
 st.set_page_config(
     page_title="CIS People Directory",
@@ -17,14 +34,21 @@ st.set_page_config(
 # Load data
 @st.cache_data
 def load_data():
-    """Load people data from JSON file."""
+    """Load people data, preferring the Parquet file over JSON and CSV."""
+    parquet_path = Path("people_data.parquet")
     json_path = Path("people_data.json")
     csv_path = Path("people_data.csv")
     
-    if json_path.exists():
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        df = pd.DataFrame(data)
+    if parquet_path.exists() and PARQUET_AVAILABLE:
+        df = pd.read_parquet(parquet_path)
+    elif json_path.exists():
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(json_path.read_bytes())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        # Build column-wise rather than from a list of row dicts
+        df = pd.DataFrame({col: [person.get(col) for person in data] for col in COLUMNS})
     elif csv_path.exists():
         df = pd.read_csv(csv_path)
     else:
@@ -32,8 +56,87 @@ def load_data():
         st.stop()
         return None
     
+    # Low-cardinality columns as categoricals so filters compare integer codes.
+    # Parquet data is already categorical and may lack a '' category, so go via object.
+    df['honorific'] = df['honorific'].astype(object).fillna('')
+    for col in ('category', 'honorific'):
+        df[col] = df[col].astype('category')
+    
+    # Sort by lowercased name so prefix searches can binary search
+    df['name_lower'] = df['name'].fillna('').str.lower()
+    df = df.sort_values('name_lower', kind='stable').reset_index(drop=True)
+    
     return df
 
+# The full frame comes from the cached load_data, so it is passed as _df to skip hashing it
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def filter_data(_df, category, honorific, search_term, search_mode='Contains'):
+    """Apply the sidebar filters to the people data."""
+    if search_term and search_mode == 'Starts with':
+        # Rows are sorted by name_lower, so matches form one contiguous slice
+        term = search_term.lower()
+        start, end = _df['name_lower'].searchsorted([term, term + '\uffff'])
+        _df = _df.iloc[start:end]
+    
+    # Combine all filters into one mask, then select rows and columns once
+    mask = np.ones(len(_df), dtype=bool)
+    
+    if category != 'All':
+        mask &= (_df['category'] == category).to_numpy()
+    
+    if honorific != 'All':
+        mask &= (_df['honorific'] == honorific).to_numpy()
+    
+    if search_term and search_mode == 'Contains':
+        mask &= _df['name'].str.contains(search_term, case=False, na=False).to_numpy()
+    
+    return _df.loc[mask, COLUMNS]
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def count_people(df):
+    """Count people by category and by (non-empty) honorific."""
+    # Categorical value_counts lists every category, so drop the zero counts
+    category_counts = df['category'].value_counts()
+    category_counts = category_counts[category_counts > 0]
+    honorific_counts = df['honorific'].value_counts()
+    # Remove empty honorifics for cleaner chart
+    honorific_counts = honorific_counts[(honorific_counts > 0) & (honorific_counts.index != '')]
+    return category_counts, honorific_counts
+
+@st.cache_data(max_entries=1)
+def precompute_stats(_df):
+    """Precompute counts and per-row flags over the full dataset."""
+    category_counts, honorific_counts = count_people(_df)
+    return {
+        'category_counts': category_counts,
+        'honorific_counts': honorific_counts,
+        'has_url': (_df['profile_url'] != 'N/A').to_numpy(),
+        'has_honorific': (_df['honorific'].notna() & (_df['honorific'] != '')).to_numpy(),
+    }
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def build_display_data(filtered_df):
+    """Format filtered people data for the table view."""
+    # Format display name with honorific
+    honorific = filtered_df['honorific'].astype(object).fillna('').astype(str)
+    name = filtered_df['name'].astype(str)
+    
+    # Keep raw URLs for the link column, blanking missing ones
+    profile_url = filtered_df['profile_url']
+    
+    # Build only the displayed columns instead of copying the whole frame
+    return pd.DataFrame({
+        'Name': np.where(honorific.eq(''), name, honorific + ' ' + name),
+        'Title': filtered_df['title'].replace('', np.nan).fillna('N/A'),
+        'Category': filtered_df['category'],
+        'Profile URL': profile_url.where(profile_url.ne('N/A') & profile_url.ne(''), None),
+    })
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize data to CSV bytes for the download button."""
+    return df.to_csv(index=False).encode('utf-8')
+
 # Main app
 st.title("👥 CIS People Directory")
 st.markdown("Browse and explore the School of Computing and Information Systems staff directory")
@@ -55,36 +158,33 @@ if df is not None and not df.empty:
     
     # Search
     search_term = st.sidebar.text_input("Search by name", "")
+    search_mode = st.sidebar.radio("Match", ["Contains", "Starts with"], horizontal=True)
     
     # Apply filters
-    filtered_df = df.copy()
-    
-    if selected_category != 'All':
-        filtered_df = filtered_df[filtered_df['category'] == selected_category]
-    
-    if selected_honorific != 'All':
-        filtered_df = filtered_df[filtered_df['honorific'] == selected_honorific]
-    
-    if search_term:
-        filtered_df = filtered_df[
-            filtered_df['name'].str.contains(search_term, case=False, na=False)
-        ]
+    filtered_df = filter_data(df, selected_category, selected_honorific, search_term, search_mode)
     
     # Statistics
+    stats = precompute_stats(df)
+    if len(filtered_df) == len(df):
+        category_counts, honorific_counts = stats['category_counts'], stats['honorific_counts']
+    else:
+        category_counts, honorific_counts = count_people(filtered_df)
+    # load_data resets the index, so it gives row positions into the precomputed flags
+    rows = filtered_df.index.to_numpy()
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total People", len(filtered_df))
     
     with col2:
-        st.metric("Categories", len(filtered_df['category'].unique()))
+        st.metric("Categories", len(category_counts))
     
     with col3:
-        st.metric("With Profile URLs", len(filtered_df[filtered_df['profile_url'] != 'N/A']))
+        st.metric("With Profile URLs", int(stats['has_url'][rows].sum()))
     
     with col4:
-        honorific_count = len(filtered_df[filtered_df['honorific'].notna() & (filtered_df['honorific'] != '')])
-        st.metric("With Honorifics", honorific_count)
+        st.metric("With Honorifics", int(stats['has_honorific'][rows].sum()))
     
     # Charts
     st.header("📊 Statistics")
@@ -93,14 +193,10 @@ if df is not None and not df.empty:
     
     with col1:
         st.subheader("People by Category")
-        category_counts = filtered_df['category'].value_counts()
         st.bar_chart(category_counts)
     
     with col2:
         st.subheader("People by Honorific")
-        honorific_counts = filtered_df['honorific'].value_counts()
-        # Remove empty honorifics for cleaner chart
-        honorific_counts = honorific_counts[honorific_counts.index != '']
         if not honorific_counts.empty:
             st.bar_chart(honorific_counts)
         else:
@@ -109,33 +205,14 @@ if df is not None and not df.empty:
     # Data table
     st.header("📋 People List")
     
-    # Format display name with honorific
-    display_df = filtered_df.copy()
-    display_df['display_name'] = display_df.apply(
-        lambda row: f"{row['honorific']} {row['name']}".strip() if pd.notna(row['honorific']) and row['honorific'] else row['name'],
-        axis=1
-    )
-    
-    # Handle empty titles
-    display_df['title'] = display_df['title'].fillna('N/A')
-    display_df['title'] = display_df['title'].replace('', 'N/A')
-    
-    # Select columns to display
-    columns_to_show = ['display_name', 'title', 'category', 'profile_url']
-    display_df = display_df[columns_to_show].copy()
-    display_df.columns = ['Name', 'Title', 'Category', 'Profile URL']
-    
-    # Format profile URLs for display
-    def format_url(url):
-        if url and url != 'N/A' and pd.notna(url):
-            return f"🔗 [View Profile]({url})"
-        return '—'
-    
-    display_df['Profile URL'] = display_df['Profile URL'].apply(format_url)
+    display_df = build_display_data(filtered_df)
     
     # Display table using Streamlit's dataframe display
     st.dataframe(
         display_df,
+        column_config={
+            'Profile URL': st.column_config.LinkColumn('Profile URL', display_text='🔗 View Profile'),
+        },
         use_container_width=True,
         hide_index=True,
         height=400
@@ -144,7 +221,7 @@ if df is not None and not df.empty:
     # Download button
     st.download_button(
         label="📥 Download filtered data as CSV",
-        data=filtered_df.to_csv(index=False),
+        data=to_csv_bytes(filtered_df),
         file_name="cis_people_filtered.csv",
         mime="text/csv"
     )
@@ -4,126 +4,264 @@ Extracts: names, titles, categories, and profile URLs.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+import re
 import csv
+import functools
+import importlib.util
+import os
 from typing import List, Dict
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlparse
 
-# Try to import selenium, fallback to requests if not available
+# Prefer orjson for faster JSON output, fallback to the standard library
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        WEBDRIVER_MANAGER_AVAILABLE = True
-    except ImportError:
-        WEBDRIVER_MANAGER_AVAILABLE = False
-    SELENIUM_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
-    WEBDRIVER_MANAGER_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+
+# Selenium and webdriver-manager are imported lazily, only when a browser is needed
+@functools.lru_cache(maxsize=None)
+def selenium_available() -> bool:
+    """Check whether Selenium is installed without importing it."""
+    return importlib.util.find_spec('selenium') is not None
+
+
+@functools.lru_cache(maxsize=None)
+def webdriver_manager_available() -> bool:
+    """Check whether webdriver-manager is installed without importing it."""
+    return importlib.util.find_spec('webdriver_manager') is not None
+
+
+# Concurrency settings for scraping category subpages
+MAX_WORKERS = 8
+REQUESTS_PER_SECOND = 4  # per-host request budget shared by all workers
+REQUEST_BURST = 4
+
+# Common honorifics followed by any whitespace, including the newlines some card headers contain
+HONORIFIC_RE = re.compile(r'^(A/Prof|Assoc Prof|Prof|Dr|Mrs|Mr|Ms|Miss)\s+')
+
+_host_limiters: Dict[str, 'RateLimiter'] = {}
+_host_limiters_lock = threading.Lock()
+
+# Shared session so consecutive requests reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
 
+# Only build the tree for tags the extractors use, skipping scripts, styles, SVG, etc.
+_STRAINER = SoupStrainer(['div', 'h2', 'h3', 'a', 'ul'])
 
-def fetch_page_requests(url: str) -> BeautifulSoup:
+# Markers of a Cloudflare challenge page served instead of the real content
+CHALLENGE_MARKERS = (b'cf_chl_', b'<title>Just a moment...</title>')
+
+
+class ChallengeDetected(Exception):
+    """Raised when a page is blocked by a bot challenge and needs a real browser."""
+
+
+def is_challenge_response(response: requests.Response) -> bool:
+    """Check whether a response is a Cloudflare bot challenge rather than the page itself."""
+    if response.headers.get('cf-mitigated', '').lower() == 'challenge':
+        return True
+    head = response.content[:4096]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def fetch_page_requests(url: str, parse_only: SoupStrainer = _STRAINER) -> BeautifulSoup:
     """Fetch and parse HTML page using requests."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    session = requests.Session()
-    response = session.get(url, headers=headers, timeout=10)
+    response = _SESSION.get(url, timeout=10)
+    if is_challenge_response(response):
+        raise ChallengeDetected(f"Bot challenge served for {url}")
     response.raise_for_status()
-    return BeautifulSoup(response.content, 'lxml')
+    return BeautifulSoup(response.content, 'lxml', parse_only=parse_only)
 
 
-def fetch_page_selenium(url: str) -> BeautifulSoup:
-    """Fetch and parse HTML page using Selenium (handles JavaScript)."""
-    if not SELENIUM_AVAILABLE:
-        raise ImportError("Selenium not installed. Install with: pip install selenium")
+class SeleniumPool:
+    """Headless Chrome driver reused across page fetches. Not thread-safe, use from one thread."""
     
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    def __init__(self):
+        self.driver = None
     
-    # Use webdriver-manager if available, otherwise try default ChromeDriver
-    if WEBDRIVER_MANAGER_AVAILABLE:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-    else:
-        driver = webdriver.Chrome(options=chrome_options)
+    def __enter__(self):
+        return self
     
-    try:
-        driver.get(url)
-        # Wait for page to load and Cloudflare challenge to complete
-        time.sleep(5)
-        html = driver.page_source
-        return BeautifulSoup(html, 'lxml')
-    finally:
-        driver.quit()
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _start_driver(self):
+        """Launch a headless Chrome instance."""
+        if not selenium_available():
+            raise ImportError("Selenium not installed. Install with: pip install selenium")
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        
+        # Use webdriver-manager if available, otherwise try default ChromeDriver
+        if webdriver_manager_available():
+            from webdriver_manager.chrome import ChromeDriverManager
+            service = Service(ChromeDriverManager().install())
+            return webdriver.Chrome(service=service, options=chrome_options)
+        return webdriver.Chrome(options=chrome_options)
+    
+    def fetch(self, url: str, parse_only: SoupStrainer = _STRAINER) -> BeautifulSoup:
+        """Fetch and parse HTML page, starting the browser on first use."""
+        if self.driver is None:
+            self.driver = self._start_driver()
+        
+        # Imported after _start_driver, which reports a missing Selenium install
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        self.driver.get(url)
+        # Wait for the Cloudflare challenge to clear and the cards to render
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'div.card'))
+            )
+        except TimeoutException:
+            pass  # Page may genuinely have no cards, parse whatever loaded
+        return BeautifulSoup(self.driver.page_source, 'lxml', parse_only=parse_only)
+    
+    def close(self):
+        """Shut down the browser if it was started."""
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
 
 
-def fetch_page(url: str, use_selenium: bool = False) -> BeautifulSoup:
-    """Fetch and parse HTML page. Tries requests first, falls back to Selenium if needed."""
+def fetch_page_selenium(url: str, parse_only: SoupStrainer = _STRAINER) -> BeautifulSoup:
+    """Fetch and parse HTML page using Selenium (handles JavaScript)."""
+    with SeleniumPool() as pool:
+        return pool.fetch(url, parse_only)
+
+
+def fetch_page(url: str, use_selenium: bool = False, selenium_pool: SeleniumPool = None,
+               parse_only: SoupStrainer = _STRAINER) -> BeautifulSoup:
+    """Fetch and parse HTML page. Tries requests first, falls back to Selenium if a bot challenge is served.
+    
+    Pass a SeleniumPool to reuse its browser instead of launching one for this page.
+    Pass parse_only=None to build the full tree rather than just the tags the extractors use.
+    """
+    fetch_browser = selenium_pool.fetch if selenium_pool else fetch_page_selenium
     if use_selenium:
-        if not SELENIUM_AVAILABLE:
+        if not selenium_available():
             raise ImportError("Selenium not installed. Install with: pip install selenium")
-        return fetch_page_selenium(url)
+        return fetch_browser(url, parse_only)
     else:
         try:
-            return fetch_page_requests(url)
-        except Exception as e:
-            if SELENIUM_AVAILABLE:
-                print(f"Requests failed ({e}), trying Selenium...")
-                return fetch_page_selenium(url)
+            return fetch_page_requests(url, parse_only)
+        except ChallengeDetected as e:
+            if selenium_available():
+                print(f"{e}, trying Selenium...")
+                return fetch_browser(url, parse_only)
             raise
 
 
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with bursts of up to `burst`. Thread-safe."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be made."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _host_limiter(url: str) -> RateLimiter:
+    """Return the rate limiter for the URL's host."""
+    host = urlparse(url).netloc
+    with _host_limiters_lock:
+        if host not in _host_limiters:
+            _host_limiters[host] = RateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
+        return _host_limiters[host]
+
+
+def fetch_page_polite(url: str) -> BeautifulSoup:
+    """Fetch a page with requests, respecting the per-host rate limit. Safe to call from threads."""
+    _host_limiter(url).acquire()
+    return fetch_page_requests(url)
+
+
 def parse_name_and_honorific(full_name: str) -> tuple[str, str]:
     """Separate honorific from name. Returns (name, honorific)."""
-    # Common honorifics
-    honorifics = ['Prof', 'A/Prof', 'Assoc Prof', 'Dr', 'Mr', 'Mrs', 'Ms', 'Miss']
-    
     full_name = full_name.strip()
-    for honorific in honorifics:
-        if full_name.startswith(honorific + ' '):
-            name = full_name[len(honorific):].strip()
-            return name, honorific
+    match = HONORIFIC_RE.match(full_name)
+    if match:
+        return full_name[match.end():], match.group(1)
     
     # No honorific found
     return full_name, ''
 
 
+# Page sections whose headers are not people categories
+IGNORED_SECTIONS = frozenset({'Featured content', 'Site footer'})
+
+
+def _is_section_or_card(tag) -> bool:
+    """Match section headers (h2 with an id) and person cards (div.card)."""
+    if tag.name == 'h2':
+        return tag.has_attr('id')
+    return tag.name == 'div' and 'card' in tag.get('class', [])
+
+
 def extract_people_data(soup: BeautifulSoup, default_category: str = None) -> List[Dict]:
     """Extract people data from parsed HTML."""
     people = []
     
-    # Find all person cards
-    cards = soup.find_all('div', class_='card')
-    
     # Track current category from section headers
     current_category = default_category or 'General'
     
-    for card in cards:
-        # Check if there's a section header before this card
-        prev_section = card.find_previous('h2', id=True)
-        if prev_section:
-            section_id = prev_section.get('id', '')
-            section_text = prev_section.get_text(strip=True)
-            if section_text and section_text not in ['Featured content', 'Site footer']:
+    # Walk section headers and person cards once, in document order
+    for element in soup.find_all(_is_section_or_card):
+        if element.name == 'h2':
+            section_text = element.get_text(strip=True)
+            if section_text and section_text not in IGNORED_SECTIONS:
                 current_category = section_text
+            continue
+        card = element
         
         person_data = {}
         
@@ -140,12 +278,7 @@ def extract_people_data(soup: BeautifulSoup, default_category: str = None) -> Li
                 
                 # Extract profile URL
                 href = name_link.get('href', '')
-                if href.startswith('http'):
-                    person_data['profile_url'] = href
-                elif href.startswith('/'):
-                    person_data['profile_url'] = 'https://cis.unimelb.edu.au' + href
-                else:
-                    person_data['profile_url'] = 'https://cis.unimelb.edu.au/' + href
+                person_data['profile_url'] = urljoin('https://cis.unimelb.edu.au/', href) if href else 'N/A'
             else:
                 full_name = header.get_text(strip=True)
                 name, honorific = parse_name_and_honorific(full_name)
@@ -170,6 +303,18 @@ def extract_people_data(soup: BeautifulSoup, default_category: str = None) -> Li
     return people
 
 
+def person_key(person: Dict) -> tuple[str, str]:
+    """Identify a person listing by profile URL (or name if they have none) and category.
+    
+    People listed under several categories keep one entry per category, so the
+    category filters in the app still count them everywhere they appear.
+    """
+    profile_url = person.get('profile_url')
+    if profile_url and profile_url != 'N/A':
+        return profile_url, person['category']
+    return person['name'], person['category']
+
+
 def find_category_links(soup: BeautifulSoup, base_url: str) -> List[tuple[str, str]]:
     """Find category links from pathfinder sections. Returns list of (category_name, url)."""
     category_links = []
@@ -187,12 +332,7 @@ def find_category_links(soup: BeautifulSoup, base_url: str) -> List[tuple[str, s
                 href = link.get('href', '')
                 
                 # Make absolute URL if relative
-                if href.startswith('/'):
-                    full_url = base_url.rstrip('/') + href
-                elif href.startswith('http'):
-                    full_url = href
-                else:
-                    full_url = base_url.rstrip('/') + '/' + href
+                full_url = urljoin(base_url.rstrip('/') + '/', href)
                 
                 category_links.append((category_name, full_url))
     
@@ -201,8 +341,12 @@ def find_category_links(soup: BeautifulSoup, base_url: str) -> List[tuple[str, s
 
 def save_to_json(data: List[Dict], filename: str = 'people_data.json'):
     """Save extracted data to JSON file."""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"Data saved to {filename}")
 
 
@@ -221,55 +365,116 @@ def save_to_csv(data: List[Dict], filename: str = 'people_data.csv'):
     print(f"Data saved to {filename}")
 
 
-def main(use_selenium: bool = True, save_html: bool = False, scrape_subpages: bool = True):
+def save_to_parquet(data: List[Dict], filename: str = 'people_data.parquet'):
+    """Save extracted data to Parquet file (typed columns for fast loading in the app)."""
+    if not data:
+        return
+    
+    try:
+        import pandas as pd
+        df = pd.DataFrame(data, columns=['name', 'honorific', 'title', 'category', 'profile_url'])
+        df = df.astype({'category': 'category', 'honorific': 'category'})
+        df.to_parquet(filename, compression='zstd', index=False)
+    except ImportError as e:
+        # Remove any stale copy so the app loads the fresh JSON/CSV instead
+        if os.path.exists(filename):
+            os.remove(filename)
+        print(f"Skipping {filename} ({e}). Install with: pip install pandas pyarrow")
+        return
+    print(f"Data saved to {filename}")
+
+
+def main(use_selenium: bool = False, save_html: bool = False, scrape_subpages: bool = True):
     """Main function to run the scraper."""
     base_url = 'https://cis.unimelb.edu.au/people'
     all_people = []
+    seen = set()
     
-    print(f"Fetching main page: {base_url}...")
-    try:
-        if use_selenium and not SELENIUM_AVAILABLE:
-            print("Selenium not available, falling back to requests...")
-            use_selenium = False
-        soup = fetch_page(base_url, use_selenium=use_selenium)
-        
-        # Optionally save HTML for inspection
-        if save_html:
-            with open('page_source.html', 'w', encoding='utf-8') as f:
-                f.write(str(soup))
-            print("HTML saved to page_source.html for inspection")
+    def add_people(people: List[Dict]):
+        """Append people not already collected under the same category."""
+        for person in people:
+            key = person_key(person)
+            if key in seen:
+                continue
+            seen.add(key)
+            all_people.append(person)
+    
+    # One browser shared by every Selenium fetch, only started if needed
+    with SeleniumPool() as selenium_pool:
+        print(f"Fetching main page: {base_url}...")
+        try:
+            if use_selenium and not selenium_available():
+                print("Selenium not available, falling back to requests...")
+                use_selenium = False
+            # Keep the full page when saving it, so the dump shows the real structure
+            soup = fetch_page(base_url, use_selenium=use_selenium, selenium_pool=selenium_pool,
+                              parse_only=None if save_html else _STRAINER)
             
-    except Exception as e:
-        print(f"Error fetching page: {e}")
-        if not use_selenium and SELENIUM_AVAILABLE:
-            print("Retrying with Selenium...")
-            soup = fetch_page(base_url, use_selenium=True)
-        else:
+            # Optionally save HTML for inspection
+            if save_html:
+                with open('page_source.html', 'w', encoding='utf-8') as f:
+                    f.write(str(soup))
+                print("HTML saved to page_source.html for inspection")
+                
+        except Exception as e:
+            print(f"Error fetching page: {e}")
             raise
-    
-    # Extract people from main page
-    print("Extracting people from main page...")
-    main_people = extract_people_data(soup)
-    all_people.extend(main_people)
-    print(f"Found {len(main_people)} people on main page")
-    
-    # Find and scrape category subpages
-    if scrape_subpages:
-        print("\nFinding category links...")
-        category_links = find_category_links(soup, 'https://cis.unimelb.edu.au')
-        print(f"Found {len(category_links)} category pages to scrape")
         
-        for category_name, category_url in category_links:
-            print(f"\nScraping: {category_name} ({category_url})...")
-            try:
-                category_soup = fetch_page(category_url, use_selenium=use_selenium)
-                category_people = extract_people_data(category_soup, default_category=category_name)
-                all_people.extend(category_people)
-                print(f"  Found {len(category_people)} people")
-                time.sleep(1)  # Be polite, add small delay between requests
-            except Exception as e:
-                print(f"  Error scraping {category_name}: {e}")
-                continue
+        # Extract people from main page
+        print("Extracting people from main page...")
+        main_people = extract_people_data(soup)
+        add_people(main_people)
+        print(f"Found {len(main_people)} people on main page")
+        
+        # Find and scrape category subpages
+        if scrape_subpages:
+            print("\nFinding category links...")
+            category_links = find_category_links(soup, 'https://cis.unimelb.edu.au')
+            print(f"Found {len(category_links)} category pages to scrape")
+            
+            # Fetch category pages concurrently with requests only; Selenium drivers are
+            # not thread-safe, so browser pages (all of them if use_selenium) go serially
+            category_results = {}
+            browser_links = []
+            if use_selenium:
+                browser_links = list(category_links)
+            else:
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    futures = {
+                        executor.submit(fetch_page_polite, category_url): (category_name, category_url)
+                        for category_name, category_url in category_links
+                    }
+                    for future in as_completed(futures):
+                        category_name, category_url = futures[future]
+                        try:
+                            category_soup = future.result()
+                        except ChallengeDetected as e:
+                            print(f"  {e}")
+                            browser_links.append((category_name, category_url))
+                            continue
+                        except Exception as e:
+                            print(f"  Error scraping {category_name}: {e}")
+                            continue
+                        category_people = extract_people_data(category_soup, default_category=category_name)
+                        category_results[category_url] = category_people
+                        print(f"Scraped: {category_name} ({category_url}) - found {len(category_people)} people")
+            
+            if browser_links and selenium_available():
+                print(f"\nFetching {len(browser_links)} category pages with Selenium...")
+                for category_name, category_url in browser_links:
+                    print(f"\nScraping: {category_name} ({category_url})...")
+                    try:
+                        category_soup = selenium_pool.fetch(category_url)
+                        category_people = extract_people_data(category_soup, default_category=category_name)
+                        category_results[category_url] = category_people
+                        print(f"  Found {len(category_people)} people")
+                    except Exception as e:
+                        print(f"  Error scraping {category_name}: {e}")
+                        continue
+            
+            # Keep results in page order regardless of completion order
+            for category_name, category_url in category_links:
+                add_people(category_results.get(category_url, []))
     
     print(f"\nTotal people found: {len(all_people)}")
     
@@ -283,9 +488,10 @@ def main(use_selenium: bool = True, save_html: bool = False, scrape_subpages: bo
             print(f"   Category: {person['category']}")
             print(f"   URL: {person['profile_url']}")
         
-        # Save to JSON and CSV
+        # Save to JSON, CSV and Parquet
         save_to_json(all_people)
         save_to_csv(all_people)
+        save_to_parquet(all_people)
     else:
         print("No people found. The HTML structure might be different.")
         print("Consider running with save_html=True to inspect the page structure.")